@@ -1,15 +1,27 @@
+import re
 import sys
-import json
+import calendar
 import time
-from dataclasses import dataclass, asdict
-from datetime import datetime
-from typing import List
-
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
+from dataclasses import dataclass, fields
+from datetime import date, datetime, timedelta
+from typing import Callable, List, Optional, Tuple
+
+import lxml.html
+import orjson
 import requests
-from bs4 import BeautifulSoup
+import requests_cache
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 # ---------- Data model ----------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Review:
     title: str
     date: str
@@ -19,6 +31,22 @@ class Review:
     source: str
     company: str
 
+    def __post_init__(self):
+        # Every review from a scrape carries the same source/company, so keep
+        # one shared copy of each string instead of one per review
+        object.__setattr__(self, "source", sys.intern(self.source))
+        object.__setattr__(self, "company", sys.intern(self.company))
+
+    def __reduce__(self):
+        # Rebuild through __init__ so reviews unpickled from parse worker
+        # processes are interned in this process too
+        return (Review, tuple(getattr(self, name) for name in REVIEW_FIELDS))
+
+
+# Review has no __dict__ (slots), so pickling reads fields by name
+REVIEW_FIELDS = tuple(f.name for f in fields(Review))
+
+
 def parse_cli_args():
     if len(sys.argv) != 5:
         print(
@@ -36,30 +64,244 @@ def parse_cli_args():
         sys.exit(1)
 
     source = sys.argv[4].lower()
-    if source not in {"g2", "capterra", "saas"}:
-        print("source must be one of: g2, capterra, saas")
+    if source not in SCRAPERS:
+        print(f"source must be one of: {', '.join(SCRAPERS)}")
         sys.exit(1)
 
     return company, start_date, end_date, source
 
 
-def in_range(date_str: str, start_d, end_d) -> bool:
-    """Try some common date formats; if parsing fails, keep the review."""
-    for fmt in ("%B %d, %Y", "%b %d, %Y", "%Y-%m-%d"):
-        try:
-            d = datetime.strptime(date_str.strip(), fmt).date()
-            return start_d <= d <= end_d
-        except ValueError:
-            continue
-    return True  # do not drop if format unknown
+# "January 5, 2024", "Jan 5, 2024" or "2024-01-05", matched in one pass
+DATE_RE = re.compile(
+    r"^(?:(?P<mon>[A-Za-z]+)\s+(?P<md>\d{1,2}),\s+(?P<my>\d{4})"
+    r"|(?P<y>\d{4})-(?P<m>\d{1,2})-(?P<d>\d{1,2}))$"
+)
+MONTH_NAMES = (
+    "january", "february", "march", "april", "may", "june",
+    "july", "august", "september", "october", "november", "december",
+)
+# Full and three-letter names, lower-cased -> month number
+MONTHS = {
+    **{name: i for i, name in enumerate(MONTH_NAMES, start=1)},
+    **{name[:3]: i for i, name in enumerate(MONTH_NAMES, start=1)},
+}
+
+
+DateKey = Tuple[int, int, int]
+
+
+def date_key(d: date) -> DateKey:
+    """(year, month, day) tuple that in_range() compares against."""
+    return (d.year, d.month, d.day)
+
+
+def in_range(date_str: str, start_t: DateKey, end_t: DateKey) -> bool:
+    """Match the common date formats; if parsing fails, keep the review."""
+    m = DATE_RE.match(date_str.strip())
+    if not m:
+        return True  # do not drop if format unknown
+
+    if m["mon"]:
+        month = MONTHS.get(m["mon"].lower())
+        if month is None:
+            return True
+        year, day = int(m["my"]), int(m["md"])
+    else:
+        year, month, day = int(m["y"]), int(m["m"]), int(m["d"])
+
+    # Impossible dates (e.g. "February 30, 2024") are kept, like unknown formats
+    if year < 1 or not 1 <= month <= 12:
+        return True
+    if not 1 <= day <= calendar.monthrange(year, month)[1]:
+        return True
+    return start_t <= (year, month, day) <= end_t
+
+
+def class_pattern(name: str) -> "re.Pattern[str]":
+    # At parse time the class attribute is still one unsplit string, so a plain
+    # class_="x" strainer misses elements like class="paper paper--box"
+    return re.compile(rf"(?:^|\s){re.escape(name)}(?:\s|$)")
+
+
+# Pages are decoded as UTF-8 up front instead of sniffing the encoding
+HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
+
+def xpath_class(name: str) -> str:
+    """XPath predicate matching the CSS class selector `.name`."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def join_text(parts: List[str], sep: str = "") -> str:
+    """Join text nodes the way BeautifulSoup's get_text(sep, strip=True) does."""
+    if len(parts) == 1:  # leaf elements (titles, dates, names) have one text node
+        return parts[0].strip()
+    return sep.join(p.strip() for p in parts if p.strip())
+
+
+def leaf_text(el) -> str:
+    """
+    Stripped text of a BeautifulSoup element. Elements with a single text
+    child read .string directly instead of walking descendants with get_text.
+    """
+    string = el.string
+    # .string can also be a Comment/CData child, which get_text() skips
+    if type(string) is NavigableString:
+        return string.strip()
+    return el.get_text(strip=True)
 
 
 def write_json(company: str, source: str, reviews: List[Review]):
-    data = [asdict(r) for r in reviews]
     fname = f"{company.lower().replace(' ', '_')}_{source}_reviews.json"
-    with open(fname, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    with open(fname, "wb") as f:
+        # Stream one review at a time; orjson serialises the dataclass directly
+        # (UTF-8, in C) in the same layout as json.dump(list, f, indent=2)
+        f.write(b"[")
+        for i, r in enumerate(reviews):
+            f.write(b",\n  " if i else b"\n  ")
+            f.write(orjson.dumps(r, option=orjson.OPT_INDENT_2).replace(b"\n", b"\n  "))
+        f.write(b"\n]" if reviews else b"]")
     print(f"Saved {len(reviews)} reviews to {fname}")
+# ---------- Fetching ----------
+
+# Fetch threads (one request in flight per worker) and pages requested per batch
+FETCH_WORKERS = 8
+PAGE_BATCH = 8
+# Start offset between the fetch threads' first requests, so the first wave
+# doesn't hit the host all at once
+STAGGER_DELAY = 0.1
+# Responses are cached in reviews_cache.sqlite; re-runs within CACHE_TTL skip the
+# network, and expired pages are revalidated with ETag/Last-Modified
+CACHE_TTL = timedelta(hours=6)
+
+
+@lru_cache(maxsize=None)
+def build_session() -> requests.Session:
+    """
+    One pooled keep-alive session shared by every scraper, backed by an
+    on-disk response cache, with retries on transient errors. Built on first
+    use, so importing this module (e.g. in parse worker processes) doesn't
+    open the cache.
+    """
+    session = requests_cache.CachedSession(
+        "reviews_cache",
+        backend="sqlite",
+        expire_after=CACHE_TTL,
+        allowable_codes=[200],
+    )
+    retries = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "User-Agent": "Mozilla/5.0 (compatible; review-scraper/1.0)",
+        # Only advertise encodings urllib3 can decode (br needs the brotli package)
+        "Accept-Encoding": ACCEPT_ENCODING,
+    })
+    return session
+
+
+def fetch_page(url: str, delay: float = 0.0) -> Tuple[int, bytes]:
+    """Blocking fetch of one page; returns (status_code, body)."""
+    session = build_session()
+    # The stagger is politeness towards the host; cached pages don't reach it
+    if delay and not session.cache.contains(url=url):
+        time.sleep(delay)
+    resp = session.get(url, timeout=20)
+    return resp.status_code, resp.content
+
+
+async def scrape_pages(
+    label: str,
+    url_for: Callable[[int], str],
+    parse_page: Callable[[bytes], Optional[List[Review]]],
+    parse_first_page: Optional[
+        Callable[[bytes], Tuple[Optional[List[Review]], Optional[int]]]
+    ] = None,
+) -> List[Review]:
+    """
+    Fetch page 1, then pages 2..total (total from parse_first_page, if given),
+    then probe PAGE_BATCH pages at a time until one is missing or empty.
+    Parse callbacks run in worker processes, so they must be picklable;
+    parse_page returns None for a page without review cards.
+    """
+    loop = asyncio.get_running_loop()
+
+    async def fetch(pool: ThreadPoolExecutor, page: int, delay: float) -> Optional[bytes]:
+        url = url_for(page)
+        print(f"[{label}] Fetching page {page}: {url}")
+        status, html = await loop.run_in_executor(pool, fetch_page, url, delay)
+        return html if status == 200 else None
+
+    async def fetch_and_parse(
+        pool: ThreadPoolExecutor, page: int, delay: float
+    ) -> Optional[List[Review]]:
+        html = await fetch(pool, page, delay)
+        if html is None:
+            return None
+        return await loop.run_in_executor(parse_pool, parse_page, html)
+
+    all_reviews: List[Review] = []
+    first_wave = True
+
+    async def fetch_batch(pool: ThreadPoolExecutor, pages: range) -> bool:
+        """Fetch and parse pages concurrently; False once a page is missing or empty."""
+        nonlocal first_wave
+        # Only the first request of each fetch thread is staggered
+        stagger, first_wave = first_wave, False
+        batch = await asyncio.gather(
+            *(
+                fetch_and_parse(
+                    pool, page, STAGGER_DELAY * i if stagger and i < FETCH_WORKERS else 0.0
+                )
+                for i, page in enumerate(pages)
+            )
+        )
+        for reviews in batch:
+            if reviews is None:
+                return False
+            all_reviews.extend(reviews)
+        return True
+
+    with (
+        ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool,
+        # spawn, not fork: by the first parse this process already has fetch
+        # threads and an open SQLite cache connection
+        ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn")) as parse_pool,
+    ):
+        first_html = await fetch(pool, 1, 0.0)
+        if first_html is None:
+            return all_reviews
+        if parse_first_page is not None:
+            first, total = await loop.run_in_executor(
+                parse_pool, parse_first_page, first_html
+            )
+        else:
+            first = await loop.run_in_executor(parse_pool, parse_page, first_html)
+            total = None
+        if first is None:
+            return all_reviews
+        all_reviews.extend(first)
+
+        base = 2
+        if total is not None:
+            print(f"[{label}] {total} pages of reviews")
+            if not await fetch_batch(pool, range(2, total + 1)):
+                return all_reviews
+            # Expected to be a miss; only keep probing if the count was low
+            base = max(total + 1, 2)
+            if not await fetch_batch(pool, range(base, base + 1)):
+                return all_reviews
+            base += 1
+
+        while await fetch_batch(pool, range(base, base + PAGE_BATCH)):
+            base += PAGE_BATCH
+    return all_reviews
 # ---------- G2 scraper ----------
 
 def build_g2_url(product_slug: str, page: int) -> str:
@@ -67,7 +309,102 @@ def build_g2_url(product_slug: str, page: int) -> str:
     return f"https://www.g2.com/products/{product_slug}/reviews?page={page}"
 
 
-def scrape_g2(company: str, start_d, end_d) -> List[Review]:
+# Compiled once; each card is queried with these instead of BeautifulSoup lookups.
+# Selectors may need adjustment after inspecting actual HTML
+# Same as the CSS selector .paper.paper--white.paper--box; G2 also uses
+# paper--box on panels that are not reviews
+G2_CARDS = etree.XPath(
+    f"//div[{xpath_class('paper')} and {xpath_class('paper--white')}"
+    f" and {xpath_class('paper--box')}]"
+)
+G2_TITLE = etree.XPath("(.//h3)[1]//text()")
+G2_DATE = etree.XPath("(.//time)[1]//text()")
+G2_RATING = etree.XPath("(.//meta[@itemprop='ratingValue'])[1]/@content")
+G2_REVIEWER = etree.XPath(f"(.//a[{xpath_class('link--header-color')}])[1]//text()")
+G2_BODY = etree.XPath("(.//div[@itemprop='reviewBody'])[1]//text()")
+# The pager only shows a window of page numbers (1 2 3 4 5 ... Next), so the
+# real last page has to come from the "Last" link's href
+G2_LAST_PAGE_HREF = etree.XPath(
+    f"(//nav[{xpath_class('pagination')}]//a"
+    "[starts-with(normalize-space(translate(., 'LAST', 'last')), 'last')])[1]/@href"
+)
+PAGE_PARAM_RE = re.compile(r"[?&]page=(\d+)")
+G2_REVIEW_COUNT = etree.XPath("(//meta[@itemprop='reviewCount'])[1]/@content")
+
+
+def extract_g2_reviews(
+    root, company: str, start_t: DateKey, end_t: DateKey
+) -> Optional[List[Review]]:
+    cards = G2_CARDS(root) if root is not None else []
+    if not cards:
+        return None
+
+    reviews: List[Review] = []
+    for card in cards:
+        title = join_text(G2_TITLE(card))
+        date_txt = join_text(G2_DATE(card))
+
+        rating_attr = G2_RATING(card)
+        rating = 0.0
+        if rating_attr and rating_attr[0]:
+            try:
+                rating = float(rating_attr[0])
+            except ValueError:
+                rating = 0.0
+
+        reviewer_name = join_text(G2_REVIEWER(card))
+        review_text = join_text(G2_BODY(card), " ")
+
+        if not in_range(date_txt, start_t, end_t):
+            continue
+
+        reviews.append(
+            Review(
+                title=title,
+                date=date_txt,
+                rating=rating,
+                reviewer_name=reviewer_name,
+                review_text=review_text,
+                source="g2",
+                company=company,
+            )
+        )
+    return reviews
+
+
+def g2_page_count(root) -> Optional[int]:
+    """Total pages from the "Last" pagination link, else from reviewCount / cards per page."""
+    if root is None:
+        return None
+
+    last_href = G2_LAST_PAGE_HREF(root)
+    m = PAGE_PARAM_RE.search(last_href[0]) if last_href else None
+    if m:
+        return int(m.group(1))
+
+    count = G2_REVIEW_COUNT(root)
+    per_page = len(G2_CARDS(root))
+    if count and count[0].strip().isdigit() and per_page:
+        return -(-int(count[0]) // per_page)  # ceiling division
+    return None
+
+
+def parse_g2_page(
+    html: bytes, company: str, start_t: DateKey, end_t: DateKey
+) -> Optional[List[Review]]:
+    root = etree.fromstring(html, HTML_PARSER)
+    return extract_g2_reviews(root, company, start_t, end_t)
+
+
+def parse_g2_first_page(
+    html: bytes, company: str, start_t: DateKey, end_t: DateKey
+) -> Tuple[Optional[List[Review]], Optional[int]]:
+    """Reviews and total page count from page 1, parsing it only once."""
+    root = etree.fromstring(html, HTML_PARSER)
+    return extract_g2_reviews(root, company, start_t, end_t), g2_page_count(root)
+
+
+async def scrape_g2(company: str, start_d, end_d) -> List[Review]:
     # Map company name to G2 slug (update this with the real Pulse slug)
     slug_map = {
         "pulse": "pulse",  # change if actual slug different
@@ -80,71 +417,97 @@ def scrape_g2(company: str, start_d, end_d) -> List[Review]:
         )
 
     slug = slug_map[key]
-    all_reviews: List[Review] = []
-    page = 1
+    start_t, end_t = date_key(start_d), date_key(end_d)
+    return await scrape_pages(
+        "G2",
+        lambda page: build_g2_url(slug, page),
+        partial(parse_g2_page, company=company, start_t=start_t, end_t=end_t),
+        partial(parse_g2_first_page, company=company, start_t=start_t, end_t=end_t),
+    )
+# ---------- Capterra scraper ----------
 
-    while True:
-        url = build_g2_url(slug, page)
-        print(f"[G2] Fetching page {page}: {url}")
-        resp = requests.get(url, timeout=20)
-        if resp.status_code != 200:
-            break
+def build_capterra_url(product_path: str, page: int) -> str:
+    # Example base: https://www.capterra.com/p/12345/Pulse/reviews/
+    base = f"https://www.capterra.com/p/{product_path}/reviews/"
+    return base if page == 1 else f"{base}?page={page}"
 
-        soup = BeautifulSoup(resp.text, "html.parser")
-        # Selector may need adjustment after inspecting actual HTML
-        cards = soup.select(".paper.paper--white.paper--box")
-        if not cards:
-            break
 
-        for card in cards:
-            title_el = card.select_one("h3")
-            title = title_el.get_text(strip=True) if title_el else ""
+# Selectors may need adjustment after inspecting HTML
+CAPTERRA_CARDS = etree.XPath(f"//section[{xpath_class('review-card')}]")
+CAPTERRA_TITLE = etree.XPath(f"(.//h3[{xpath_class('review-card__title')}])[1]//text()")
+CAPTERRA_DATE = etree.XPath(f"(.//span[{xpath_class('review-card__date')}])[1]//text()")
+CAPTERRA_RATING = etree.XPath(f"(.//span[{xpath_class('star-rating__rating')}])[1]//text()")
+CAPTERRA_REVIEWER = etree.XPath(
+    f"(.//span[{xpath_class('review-card__reviewer-name')}])[1]//text()"
+)
+CAPTERRA_BODY = etree.XPath(f"(.//p[{xpath_class('review-card__review-text')}])[1]//text()")
+# e.g. "Page 1 of 23"
+CAPTERRA_PAGE_COUNT = etree.XPath(f"(//div[{xpath_class('pagination__page-count')}])[1]//text()")
+
+
+def extract_capterra_reviews(
+    root, company: str, start_t: DateKey, end_t: DateKey
+) -> Optional[List[Review]]:
+    cards = CAPTERRA_CARDS(root) if root is not None else []
+    if not cards:
+        return None
+
+    reviews: List[Review] = []
+    for card in cards:
+        title = join_text(CAPTERRA_TITLE(card))
+        date_txt = join_text(CAPTERRA_DATE(card))
+
+        rating_txt = join_text(CAPTERRA_RATING(card))
+        try:
+            rating = float(rating_txt) if rating_txt else 0.0
+        except ValueError:
+            rating = 0.0
 
-            date_el = card.find("time")
-            date_txt = date_el.get_text(strip=True) if date_el else ""
+        reviewer_name = join_text(CAPTERRA_REVIEWER(card))
+        review_text = join_text(CAPTERRA_BODY(card), " ")
 
-            rating_el = card.find("meta", itemprop="ratingValue")
-            rating = 0.0
-            if rating_el and rating_el.get("content"):
-                try:
-                    rating = float(rating_el["content"])
-                except ValueError:
-                    rating = 0.0
-
-            user_el = card.select_one("a.link--header-color")
-            reviewer_name = user_el.get_text(strip=True) if user_el else ""
-
-            body_el = card.find("div", itemprop="reviewBody")
-            review_text = body_el.get_text(" ", strip=True) if body_el else ""
-
-            if not in_range(date_txt, start_d, end_d):
-                continue
-
-            all_reviews.append(
-                Review(
-                    title=title,
-                    date=date_txt,
-                    rating=rating,
-                    reviewer_name=reviewer_name,
-                    review_text=review_text,
-                    source="g2",
-                    company=company,
-                )
+        if not in_range(date_txt, start_t, end_t):
+            continue
+
+        reviews.append(
+            Review(
+                title=title,
+                date=date_txt,
+                rating=rating,
+                reviewer_name=reviewer_name,
+                review_text=review_text,
+                source="capterra",
+                company=company,
             )
+        )
+    return reviews
 
-        page += 1
-        time.sleep(1)
 
-    return all_reviews
-# ---------- Capterra scraper ----------
+def capterra_page_count(root) -> Optional[int]:
+    """Total pages from the "Page X of N" counter, if present."""
+    if root is None:
+        return None
+    numbers = re.findall(r"\d+", join_text(CAPTERRA_PAGE_COUNT(root), " "))
+    return int(numbers[-1]) if numbers else None
+
+
+def parse_capterra_page(
+    html: bytes, company: str, start_t: DateKey, end_t: DateKey
+) -> Optional[List[Review]]:
+    root = etree.fromstring(html, HTML_PARSER)
+    return extract_capterra_reviews(root, company, start_t, end_t)
 
-def build_capterra_url(product_path: str, page: int) -> str:
-    # Example base: https://www.capterra.com/p/12345/Pulse/reviews/
-    base = f"https://www.capterra.com/p/{product_path}/reviews/"
-    return base if page == 1 else f"{base}?page={page}"
 
+def parse_capterra_first_page(
+    html: bytes, company: str, start_t: DateKey, end_t: DateKey
+) -> Tuple[Optional[List[Review]], Optional[int]]:
+    """Reviews and total page count from page 1, parsing it only once."""
+    root = etree.fromstring(html, HTML_PARSER)
+    reviews = extract_capterra_reviews(root, company, start_t, end_t)
+    return reviews, capterra_page_count(root)
 
-def scrape_capterra(company: str, start_d, end_d) -> List[Review]:
+
+async def scrape_capterra(company: str, start_d, end_d) -> List[Review]:
     # Map company name to Capterra product path (ID/Name from URL)
     slug_map = {
         "pulse": "12345/Pulse",  # replace 12345/Pulse with real path
@@ -157,120 +520,77 @@ def scrape_capterra(company: str, start_d, end_d) -> List[Review]:
         )
 
     path = slug_map[key]
-    all_reviews: List[Review] = []
-    page = 1
-
-    while True:
-        url = build_capterra_url(path, page)
-        print(f"[Capterra] Fetching page {page}: {url}")
-        resp = requests.get(url, timeout=20)
-        if resp.status_code != 200:
-            break
-
-        soup = BeautifulSoup(resp.text, "html.parser")
-        # Selector may need adjustment after inspecting HTML
-        cards = soup.select("section.review-card")
-        if not cards:
-            break
-
-        for card in cards:
-            title_el = card.select_one("h3.review-card__title")
-            title = title_el.get_text(strip=True) if title_el else ""
+    start_t, end_t = date_key(start_d), date_key(end_d)
+    return await scrape_pages(
+        "Capterra",
+        lambda page: build_capterra_url(path, page),
+        partial(parse_capterra_page, company=company, start_t=start_t, end_t=end_t),
+        partial(parse_capterra_first_page, company=company, start_t=start_t, end_t=end_t),
+    )
+# ---------- Bonus: third (example) source ----------
 
-            date_el = card.select_one("span.review-card__date")
-            date_txt = date_el.get_text(strip=True) if date_el else ""
+SAAS_STRAINER = SoupStrainer(class_=class_pattern("review-card"))
 
-            rating_el = card.select_one("span.star-rating__rating")
-            try:
-                rating = float(rating_el.get_text(strip=True)) if rating_el else 0.0
-            except ValueError:
-                rating = 0.0
 
-            user_el = card.select_one("span.review-card__reviewer-name")
-            reviewer_name = user_el.get_text(strip=True) if user_el else ""
+def parse_saas_page(
+    html: bytes, company: str, start_t: DateKey, end_t: DateKey
+) -> Optional[List[Review]]:
+    soup = BeautifulSoup(html, "lxml", from_encoding="utf-8", parse_only=SAAS_STRAINER)
+    cards = soup.find_all(recursive=False)
+    if not cards:
+        return None
 
-            body_el = card.select_one("p.review-card__review-text")
-            review_text = body_el.get_text(" ", strip=True) if body_el else ""
+    reviews: List[Review] = []
+    for card in cards:
+        title = leaf_text(card.select_one(".review-title"))
+        date_txt = leaf_text(card.select_one(".review-date"))
+        rating = float(card.select_one(".review-rating")["data-score"])
+        reviewer_name = leaf_text(card.select_one(".reviewer-name"))
+        review_text = card.select_one(".review-body").get_text(" ", strip=True)
 
-            if not in_range(date_txt, start_d, end_d):
-                continue
+        if not in_range(date_txt, start_t, end_t):
+            continue
 
-            all_reviews.append(
-                Review(
-                    title=title,
-                    date=date_txt,
-                    rating=rating,
-                    reviewer_name=reviewer_name,
-                    review_text=review_text,
-                    source="capterra",
-                    company=company,
-                )
+        reviews.append(
+            Review(
+                title=title,
+                date=date_txt,
+                rating=rating,
+                reviewer_name=reviewer_name,
+                review_text=review_text,
+                source="saas",
+                company=company,
             )
+        )
+    return reviews
 
-        page += 1
-        time.sleep(1)
 
-    return all_reviews
-# ---------- Bonus: third (example) source ----------
-
-def scrape_saas_example(company: str, start_d, end_d) -> List[Review]:
+async def scrape_saas_example(company: str, start_d, end_d) -> List[Review]:
     """
     Placeholder for a third SaaS review site.
     Replace URL and CSS selectors with the real site you choose.
     """
     base_url = f"https://example-saas-reviews.com/{company.lower()}/reviews?page="
-    all_reviews: List[Review] = []
-    page = 1
-
-    while True:
-        url = base_url + str(page)
-        print(f"[SAAS] Fetching page {page}: {url}")
-        resp = requests.get(url, timeout=20)
-        if resp.status_code != 200:
-            break
-
-        soup = BeautifulSoup(resp.text, "html.parser")
-        cards = soup.select(".review-card")
-        if not cards:
-            break
-
-        for card in cards:
-            title = card.select_one(".review-title").get_text(strip=True)
-            date_txt = card.select_one(".review-date").get_text(strip=True)
-            rating = float(card.select_one(".review-rating")["data-score"])
-            reviewer_name = card.select_one(".reviewer-name").get_text(strip=True)
-            review_text = card.select_one(".review-body").get_text(" ", strip=True)
-
-            if not in_range(date_txt, start_d, end_d):
-                continue
-
-            all_reviews.append(
-                Review(
-                    title=title,
-                    date=date_txt,
-                    rating=rating,
-                    reviewer_name=reviewer_name,
-                    review_text=review_text,
-                    source="saas",
-                    company=company,
-                )
-            )
+    start_t, end_t = date_key(start_d), date_key(end_d)
+    return await scrape_pages(
+        "SAAS",
+        lambda page: base_url + str(page),
+        partial(parse_saas_page, company=company, start_t=start_t, end_t=end_t),
+    )
+# ---------- Main ----------
 
-        page += 1
-        time.sleep(1)
+# CLI source name -> scraper coroutine
+SCRAPERS = {
+    "g2": scrape_g2,
+    "capterra": scrape_capterra,
+    "saas": scrape_saas_example,
+}
 
-    return all_reviews
-# ---------- Main ----------
 
 def main():
     company, start_d, end_d, source = parse_cli_args()
 
-    if source == "g2":
-        reviews = scrape_g2(company, start_d, end_d)
-    elif source == "capterra":
-        reviews = scrape_capterra(company, start_d, end_d)
-    else:
-        reviews = scrape_saas_example(company, start_d, end_d)
+    reviews = asyncio.run(SCRAPERS[source](company, start_d, end_d))
 
     write_json(company, source, reviews)
 